@@ -0,0 +1,55 @@
+"""
+Compare one-entry-per-page output with dense pagination for both backends.
+
+Usage: python benchmarks/bench_dense_pagination.py [entries]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import generate_reports
+from generate_reports import create_pdf, create_word
+from synthetic import make_entries
+
+
+def render_pdf(entries, path, dense):
+    start = time.perf_counter()
+    pages = create_pdf(entries, path, dense=dense)
+    return pages, os.path.getsize(path), time.perf_counter() - start
+
+
+def render_word(entries, path, dense):
+    start = time.perf_counter()
+    create_word(entries, path, dense=dense)
+    return os.path.getsize(path), time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    entries = make_entries(count)
+    generate_reports.print = lambda *args, **kwargs: None
+    generate_reports.logging.disable(generate_reports.logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        pdf_paged = render_pdf(entries, os.path.join(tmp, "paged.pdf"), False)
+        pdf_dense = render_pdf(entries, os.path.join(tmp, "dense.pdf"), True)
+        word_paged = render_word(entries, os.path.join(tmp, "paged.docx"), False)
+        word_dense = render_word(entries, os.path.join(tmp, "dense.docx"), True)
+
+    print(f"entries: {count}")
+    print(f"PDF  one per page: {pdf_paged[0]} pages, "
+          f"{pdf_paged[1] / 1024:.0f} KiB, {pdf_paged[2]:.2f}s")
+    print(f"PDF  dense:        {pdf_dense[0]} pages, "
+          f"{pdf_dense[1] / 1024:.0f} KiB, {pdf_dense[2]:.2f}s")
+    print(f"PDF  savings:      {pdf_paged[0] - pdf_dense[0]} pages "
+          f"({1 - pdf_dense[0] / pdf_paged[0]:.0%}), "
+          f"{1 - pdf_dense[1] / pdf_paged[1]:.0%} of bytes")
+    print(f"Word one per page: {word_paged[0] / 1024:.0f} KiB, {word_paged[1]:.2f}s")
+    print(f"Word dense:        {word_dense[0] / 1024:.0f} KiB, {word_dense[1]:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Compare the memory held by parsed entries as dicts and as Entry records.
+
+Usage: python benchmarks/bench_entry_memory.py [entries]
+"""
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import generate_reports
+from generate_reports import Entry
+from synthetic import make_entries
+
+
+def fresh(value):
+    # parse_docx slices every value out of the document text, so repeated
+    # values are distinct string objects; mimic that here.
+    return value[:1] + value[1:]
+
+
+def parsed_dicts(templates):
+    return [{field: fresh(value) for field, value in template.items()}
+            for template in templates]
+
+
+def parsed_entries(templates):
+    return [
+        Entry(title=fresh(t["Title"]),
+              date=fresh(t["Date"]),
+              country=fresh(t["Country"]),
+              summary=fresh(t["Summary"]),
+              key_aspects=generate_reports.tokenize_key_aspects(
+                  fresh(t["Key Aspects"])),
+              link=fresh(t["Link"]),
+              availability=fresh(t["Availability"])) for t in templates
+    ]
+
+
+def measure(build, templates):
+    tracemalloc.start()
+    result = build(templates)
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return current
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    templates = make_entries(count)
+
+    dict_bytes = measure(parsed_dicts, templates)
+    entry_bytes = measure(parsed_entries, templates)
+
+    print(f"entries:  {count}")
+    print(f"dicts:    {dict_bytes / 2**20:.1f} MiB "
+          f"({dict_bytes / count:.0f} bytes/entry)")
+    print(f"Entry:    {entry_bytes / 2**20:.1f} MiB "
+          f"({entry_bytes / count:.0f} bytes/entry, "
+          f"{1 - entry_bytes / dict_bytes:.0%} less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Compare default PDF output with --optimize-pdf output.
+
+Usage: python benchmarks/bench_pdf_output.py [entries]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import generate_reports
+from generate_reports import create_pdf, text_layout_cache
+from synthetic import make_entries
+
+
+def render(entries, path, optimize):
+    # Each run starts cold so neither inherits the other's layouts
+    text_layout_cache.clear()
+    start = time.perf_counter()
+    pages = create_pdf(entries, path, optimize=optimize)
+    elapsed = time.perf_counter() - start
+    return pages, os.path.getsize(path), elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    entries = make_entries(count)
+    generate_reports.print = lambda *args, **kwargs: None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        results = {
+            "default": render(entries, os.path.join(tmp, "default.pdf"), False),
+            "optimized": render(entries, os.path.join(tmp, "optimized.pdf"), True),
+        }
+
+    print(f"entries: {count}")
+    for name, (pages, size, elapsed) in results.items():
+        print(f"{name:<10} {pages} pages, {size / 1024:.0f} KiB, "
+              f"{size / pages:.0f} bytes/page, {elapsed:.2f}s to build")
+    default_size = results["default"][1]
+    optimized_size = results["optimized"][1]
+    print(f"size reduction: {1 - optimized_size / default_size:.1%}")
+
+
+if __name__ == "__main__":
+    main()
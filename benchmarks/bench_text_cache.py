@@ -0,0 +1,52 @@
+"""
+Benchmark the PDF text layout cache on a digest with realistic repetition.
+
+Usage: python benchmarks/bench_text_cache.py [entries] [repeats]
+"""
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import generate_reports
+from generate_reports import create_pdf, text_layout_cache
+from synthetic import make_entries
+
+
+def render(entries, maxsize):
+    text_layout_cache.clear()
+    text_layout_cache.maxsize = maxsize
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        create_pdf(entries, os.path.join(tmp, "bench.pdf"))
+        return time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeats = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+    entries = make_entries(count)
+    # The per-entry progress prints would dominate the timings
+    generate_reports.print = lambda *args, **kwargs: None
+
+    # Alternate the runs and keep the best of each, as single timings of
+    # a multi-second render vary by more than the difference measured
+    uncached, cached = [], []
+    for _ in range(repeats):
+        uncached.append(render(entries, 0))
+        cached.append(render(entries, 4096))
+    uncached, cached = min(uncached), min(cached)
+    stats = text_layout_cache.stats()
+
+    print(f"entries:   {count} (best of {repeats})")
+    print(f"uncached:  {uncached:.2f}s")
+    print(f"cached:    {cached:.2f}s ({uncached / cached:.2f}x)")
+    for field, (hits, misses) in stats["fields"].items():
+        print(f"{field + ':':<14} {hits / (hits + misses):.1%} hit rate "
+              f"({hits} hits, {misses} misses)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""
+Benchmark Word output: generation time, file size and document.xml size.
+
+Usage: python benchmarks/bench_word_output.py [entries]
+"""
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import generate_reports
+from generate_reports import create_word
+from synthetic import make_entries
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    entries = make_entries(count)
+    generate_reports.print = lambda *args, **kwargs: None
+    generate_reports.logging.disable(generate_reports.logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_docx = os.path.join(tmp, "bench.docx")
+        start = time.perf_counter()
+        create_word(entries, output_docx)
+        elapsed = time.perf_counter() - start
+        size = os.path.getsize(output_docx)
+        with zipfile.ZipFile(output_docx) as archive:
+            document_xml = archive.getinfo("word/document.xml").file_size
+
+    print(f"entries:       {count}")
+    print(f"create_word:   {elapsed:.2f}s")
+    print(f"output size:   {size / 1024:.0f} KiB")
+    print(f"document.xml:  {document_xml / 1024:.0f} KiB "
+          f"({document_xml / count:.0f} bytes/entry)")
+
+
+if __name__ == "__main__":
+    main()
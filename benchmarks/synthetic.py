@@ -0,0 +1,31 @@
+import random
+
+# Field values drawn from real digests; Availability, Date and Country repeat
+# heavily, titles and summaries mostly do not.
+AVAILABILITIES = ["Publicly available", "Subscription", "Members only"]
+COUNTRIES = ["Luxembourg", "Ireland", "UK", "Switzerland", "European Union"]
+DATES = [f"{day:02d}/{month:02d}/2024" for month in range(1, 13)
+         for day in (1, 15, 28)]
+TOPICS = ["AML", "ESG disclosures", "UCITS", "AIFMD", "DORA", "MiCA",
+          "Sanctions", "Outsourcing", "Cloud", "Tax reporting"]
+
+
+def make_entries(count, seed=0):
+    """Return ``count`` synthetic entry dicts with digest-like repetition."""
+    rng = random.Random(seed)
+    entries = []
+    for i in range(count):
+        topic = rng.choice(TOPICS)
+        entries.append({
+            "Title": f"Circular {i} on {topic} requirements for regulated "
+                     f"investment fund managers",
+            "Date": rng.choice(DATES),
+            "Country": rng.choice(COUNTRIES),
+            "Summary": f"The regulator published guidance on {topic} "
+                       f"(reference {i}) clarifying supervisory expectations.",
+            "Key Aspects": "- Scope of application - Transitional period"
+                           f" - {topic} reporting templates",
+            "Link": f"https://example.org/publications/{i}",
+            "Availability": rng.choice(AVAILABILITIES),
+        })
+    return entries
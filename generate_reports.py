@@ -4,6 +4,8 @@ from docx.oxml import parse_xml
 from docx.oxml.ns import nsdecls, qn
 from docx.enum.table import WD_ALIGN_VERTICAL, WD_ROW_HEIGHT_RULE
 from docx.enum.text import WD_PARAGRAPH_ALIGNMENT, WD_BREAK
+from reportlab import rl_config
+from reportlab.rl_config import _FUZZ
 from reportlab.lib.pagesizes import A4
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Image, Paragraph, Spacer, PageBreak
 from reportlab.lib import colors
@@ -13,9 +15,17 @@ from reportlab.lib import colors
 from reportlab.platypus import ListFlowable, ListItem, KeepTogether, Flowable
 import os
 import re
+import time
+import sys
 import argparse
+from bisect import bisect_right
+import hashlib
+import io
+import json
 import logging
-from docx.enum.table import WD_TABLE_ALIGNMENT
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
 
 # Custom One Consulting blue color
 one_consult_blue = colors.Color(87 / 255, 155 / 255, 156 / 255, 1)  # RGBA
@@ -54,12 +64,173 @@ value_style = ParagraphStyle(
     leading=12,
 )
 
+# Increase font leading for multiline wrapping text to avoid overlap
+summary_style = ParagraphStyle(
+    'SummaryStyle',
+    parent=value_style,
+    leading=16,
+)
+
+
+class TextLayoutCache:
+    """
+    Bounded LRU cache of parsed and wrapped paragraph text.
+
+    Keys are (text, style, font name, font size, leading, bullet text);
+    values hold reportlab's parsed fragments and the line breaks
+    (``blPara``) and height for each wrap width. Parsing the paragraph
+    markup costs far more than breaking the lines, so both are kept. The
+    style object itself is part of the key because the fragments carry
+    style attributes such as the text colour. Lookups made for a named
+    entry ``field`` are also counted per field, so the hit rate of values
+    such as Availability and Date is not swamped by the constant labels.
+    A ``maxsize`` of 0 disables caching.
+    """
+
+    def __init__(self, maxsize=4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.field_stats = {}
+        self._layouts = OrderedDict()
+
+    def get(self, key, field=None):
+        layout = self._layouts.get(key)
+        if field is not None:
+            counts = self.field_stats.setdefault(field, [0, 0])
+            counts[layout is None] += 1
+        if layout is None:
+            self.misses += 1
+            return None
+        self._layouts.move_to_end(key)
+        self.hits += 1
+        return layout
+
+    def put(self, key, layout):
+        if self.maxsize <= 0:
+            return
+        self._layouts[key] = layout
+        self._layouts.move_to_end(key)
+        while len(self._layouts) > self.maxsize:
+            self._layouts.popitem(last=False)
+
+    def clear(self):
+        self._layouts.clear()
+        self.hits = 0
+        self.misses = 0
+        self.field_stats = {}
+
+    @property
+    def hit_rate(self):
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._layouts),
+            "maxsize": self.maxsize,
+            "hit_rate": self.hit_rate,
+            "fields": {field: tuple(counts)
+                       for field, counts in self.field_stats.items()},
+        }
+
+
+text_layout_cache = TextLayoutCache()
+
+
+class CachedParagraph(Paragraph):
+    """
+    Paragraph that reuses parsed text and line breaks from
+    ``text_layout_cache``. ``field`` names the entry field the text comes
+    from, for the per-field hit rates.
+    """
+
+    def __init__(self, text, style=None, bulletText=None, frags=None,
+                 caseSensitive=1, encoding='utf8', field=None):
+        self.field = field
+        Paragraph.__init__(self, text, style, bulletText, frags,
+                           caseSensitive, encoding)
+
+    def _setup(self, text, style, bulletText, frags, cleaner):
+        self._layouts = None
+        # Split fragments arrive already parsed
+        if frags is not None or text is None:
+            return Paragraph._setup(self, text, style, bulletText, frags,
+                                    cleaner)
+        key = (text, style, style.fontName, style.fontSize, style.leading,
+               bulletText)
+        cached = text_layout_cache.get(key, getattr(self, 'field', None))
+        if cached is None:
+            Paragraph._setup(self, text, style, bulletText, frags, cleaner)
+            cached = ((self.text, self.style, self.frags, self.bulletText),
+                      {})
+            text_layout_cache.put(key, cached)
+        else:
+            (self.text, self.style, self.frags,
+             self.bulletText), _ = cached
+            self.debug = 0
+        self._layouts = cached[1]
+
+    def wrap(self, availWidth, availHeight):
+        style = self.style
+        # Paragraph.wrap does not break lines without room; CJK and auto
+        # leading are rare enough here not to be worth caching.
+        if (self._layouts is None or availWidth < _FUZZ
+                or style.wordWrap == 'CJK'
+                or getattr(style, 'autoLeading', '') not in ('', 'off')):
+            return Paragraph.wrap(self, availWidth, availHeight)
+        first_line_width = (availWidth - style.leftIndent -
+                            style.firstLineIndent - style.rightIndent)
+        later_widths = availWidth - style.leftIndent - style.rightIndent
+        widths = (first_line_width, later_widths)
+        layout = self._layouts.get(widths)
+        if layout is None:
+            width, height = Paragraph.wrap(self, availWidth, availHeight)
+            # Line breaking may swap the fragments for a word list that
+            # the break positions index into
+            self._layouts[widths] = (self.blPara, self.frags, height)
+            return width, height
+        self.width = availWidth
+        self._wrapWidths = list(widths)
+        self.blPara, self.frags, self.height = layout
+        return self.width, self.height
+
+
+def split_title(title):
+    """Split titles longer than 40 characters over two lines at the middle word."""
+    if len(title) > 40:
+        parts = title.split(' ')
+        mid = len(parts) // 2
+        return ' '.join(parts[:mid]) + '\n' + ' '.join(parts[mid:])
+    return title
+
+
+# Regex pattern: Key Aspects is a single string (may be empty)
+ENTRY_PATTERN = (
+    r'Title:\s*(.*?)\s+Date:\s*(.*?)\s+Country:\s*(.*?)\s+Summary:\s*(.*?)'
+    r'(?:\s+Key Aspects:\s*((?:- .*\s*)*))?'
+    r'Link:\s*(.*?)\s+Availability:\s*(.*)')
+
+# Field labels in the order entries must list them
+ENTRY_LABELS = [
+    "Title", "Date", "Country", "Summary", "Key Aspects", "Link",
+    "Availability"
+]
+OPTIONAL_LABELS = ["Key Aspects"]
+
+
+def load_paragraphs(file_path):
+    """Return (paragraph index, stripped text) for each non-empty paragraph."""
+    document = DocxDocument(file_path)
+    return [(idx, p.text.strip()) for idx, p in enumerate(document.paragraphs)
+            if p.text.strip()]
+
 
 def parse_docx(file_path):
     print(f"[parse_docx] Loading document: {file_path}")
-    document = DocxDocument(file_path)
-    full_text = ' '.join(
-        [p.text.strip() for p in document.paragraphs if p.text.strip()])
+    full_text = ' '.join(text for _, text in load_paragraphs(file_path))
     print(f"[parse_docx] Full text length: {len(full_text)} chars")
 
     raw_entries = re.split(r'(?=Title:)', full_text)
@@ -68,11 +239,6 @@ def parse_docx(file_path):
     )
 
     entries = []
-    # Regex pattern: Key Aspects is a single string (may be empty)
-    pattern = (
-        r'Title:\s*(.*?)\s+Date:\s*(.*?)\s+Country:\s*(.*?)\s+Summary:\s*(.*?)'
-        r'(?:\s+Key Aspects:\s*((?:- .*\s*)*))?'
-        r'Link:\s*(.*?)\s+Availability:\s*(.*)')
 
     for idx, entry_text in enumerate(raw_entries):
         entry_text = entry_text.strip()
@@ -80,7 +246,7 @@ def parse_docx(file_path):
             continue
         print(f"[parse_docx] Parsing entry #{idx+1}")
 
-        match = re.match(pattern, entry_text, re.DOTALL)
+        match = re.match(ENTRY_PATTERN, entry_text, re.DOTALL)
         if not match:
             print(
                 f"  [WARNING] Entry #{idx+1} does not match expected format!")
@@ -93,18 +259,19 @@ def parse_docx(file_path):
         else:
             key_aspects = ""
 
-        entry = {
-            "Title": match.group(1).strip(),
-            "Date": match.group(2).strip(),
-            "Country": match.group(3).strip(),
-            "Summary": match.group(4).strip(),
-            "Key Aspects": key_aspects,
-            "Link": match.group(6).strip(),
-            "Availability": match.group(7).strip(),
-        }
+        entry = Entry(
+            title=match.group(1).strip(),
+            date=match.group(2).strip(),
+            country=match.group(3).strip(),
+            summary=match.group(4).strip(),
+            key_aspects=tokenize_key_aspects(key_aspects),
+            link=match.group(6).strip(),
+            availability=match.group(7).strip(),
+        )
+        entry.validate(idx + 1)
 
         print(
-            f"  Parsed Key Aspects for '{entry['Title']}': {entry['Key Aspects'][:50]}{'...' if len(entry['Key Aspects'])>50 else ''}"
+            f"  Parsed Key Aspects for '{entry.title}': {key_aspects[:50]}{'...' if len(key_aspects)>50 else ''}"
         )
 
         entries.append(entry)
@@ -113,6 +280,112 @@ def parse_docx(file_path):
     return entries
 
 
+def _diagnose_entry(entry_text, paragraph_at):
+    """
+    Explain why an entry does not parse, or which required values are empty.
+
+    ``paragraph_at`` maps an offset in ``entry_text`` to a paragraph index.
+    """
+    match = re.match(ENTRY_PATTERN, entry_text, re.DOTALL)
+    if match:
+        values = dict(zip(ENTRY_LABELS, match.groups()))
+        return [{
+            "field": field,
+            "problem": "empty",
+            "paragraph": paragraph_at(match.start(ENTRY_LABELS.index(field) + 1)),
+        } for field in REQUIRED_FIELDS if not (values[field] or "").strip()]
+
+    if not entry_text.startswith("Title:"):
+        # Text before the first entry
+        return [{"field": "Title", "problem": "missing", "paragraph": paragraph_at(0)}]
+
+    diagnostics = []
+    found = []
+    for rank, label in enumerate(ENTRY_LABELS):
+        position = entry_text.find(label + ":")
+        if position == -1:
+            if label not in OPTIONAL_LABELS:
+                diagnostics.append({
+                    "field": label,
+                    "problem": "missing",
+                    "paragraph": paragraph_at(0),
+                })
+        else:
+            found.append((position, rank, label))
+
+    highest_rank = -1
+    for position, rank, label in sorted(found):
+        if rank < highest_rank:
+            diagnostics.append({
+                "field": label,
+                "problem": "misordered",
+                "paragraph": paragraph_at(position),
+            })
+        highest_rank = max(highest_rank, rank)
+
+    if not diagnostics:
+        # All labels present and in order, but a value is malformed (e.g.
+        # Key Aspects not written as "- " bullets)
+        diagnostics.append({
+            "field": None,
+            "problem": "malformed",
+            "paragraph": paragraph_at(0),
+        })
+    return diagnostics
+
+
+def check_docx(file_path):
+    """
+    Run only the parsing stage on ``file_path`` and collect diagnostics.
+
+    Entries are numbered as in parse_docx; paragraph indices refer to
+    ``document.paragraphs``.
+    """
+    try:
+        paragraphs = load_paragraphs(file_path)
+    except Exception as e:
+        return {"file": file_path, "ok": False, "error": str(e),
+                "entries": 0, "valid": 0, "errors": []}
+
+    # Offsets of each paragraph in the joined text, as built by parse_docx
+    starts = []
+    offset = 0
+    for _, text in paragraphs:
+        starts.append(offset)
+        offset += len(text) + 1
+    full_text = ' '.join(text for _, text in paragraphs)
+
+    entries = 0
+    errors = []
+    offset = 0
+    for idx, raw_entry in enumerate(re.split(r'(?=Title:)', full_text)):
+        entry_start = offset + len(raw_entry) - len(raw_entry.lstrip())
+        offset += len(raw_entry)
+        entry_text = raw_entry.strip()
+        if not entry_text:
+            continue
+        entries += 1
+
+        def paragraph_at(position, entry_start=entry_start):
+            slot = max(bisect_right(starts, entry_start + position) - 1, 0)
+            return paragraphs[slot][0]
+
+        for diagnostic in _diagnose_entry(entry_text, paragraph_at):
+            errors.append(dict(entry=idx + 1, **diagnostic))
+
+    bad_entries = len({error["entry"] for error in errors})
+    return {"file": file_path, "ok": not errors, "entries": entries,
+            "valid": entries - bad_entries, "errors": errors}
+
+
+def check_files(files, jobs=None):
+    """Check ``files`` in a process pool and return a JSON-ready report."""
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(check_docx, files))
+    return {"ok": all(result["ok"] for result in results),
+            "files": results}
+
+
 def tokenize_key_aspects(key_aspects_str):
     """Split Key Aspects string into a list of bullet points, robust to both multi-line and single-line formats."""
     if not key_aspects_str:
@@ -128,25 +401,188 @@ def tokenize_key_aspects(key_aspects_str):
     return parts
 
 
-def build_table_for_entry(entry):
-    print(
-        f"[build_table_for_entry] Building table for entry: {entry['Title']}")
+# --- Entry record ---
+REQUIRED_FIELDS = ["Title", "Date", "Country", "Summary", "Link", "Availability"]
+
+
+class Entry:
+    """
+    A single report entry, prepared once for both backends.
+
+    ``key_aspects`` holds the tokenised bullet points and ``display_title``
+    the title split for the table header. Date, Country and Availability
+    repeat across a digest and are interned. Read-only dict-style access by
+    field name ("Title", "Key Aspects", ...) is kept for older callers.
+    """
+
+    __slots__ = ("title", "date", "country", "summary", "key_aspects",
+                 "link", "availability", "display_title")
+
+    # Field name -> attribute
+    FIELDS = {
+        "Title": "title",
+        "Date": "date",
+        "Country": "country",
+        "Summary": "summary",
+        "Key Aspects": "key_aspects",
+        "Link": "link",
+        "Availability": "availability",
+    }
+
+    def __init__(self, title, date, country, summary, key_aspects, link,
+                 availability):
+        self.title = title
+        self.date = sys.intern(date)
+        self.country = sys.intern(country)
+        self.summary = summary
+        self.key_aspects = tuple(key_aspects)
+        self.link = link
+        self.availability = sys.intern(availability)
+        self.display_title = split_title(title)
+
+    @classmethod
+    def from_dict(cls, data, index=None):
+        """Build and validate an Entry from a dict keyed by field name."""
+        key_aspects = data.get("Key Aspects") or ""
+        if isinstance(key_aspects, str):
+            key_aspects = tokenize_key_aspects(key_aspects)
+        entry = cls(
+            title=(data.get("Title") or "").strip(),
+            date=(data.get("Date") or "").strip(),
+            country=(data.get("Country") or "").strip(),
+            summary=(data.get("Summary") or "").strip(),
+            key_aspects=key_aspects,
+            link=(data.get("Link") or "").strip(),
+            availability=(data.get("Availability") or "").strip(),
+        )
+        entry.validate(index)
+        return entry
+
+    def validate(self, index=None):
+        """Log and return the required fields that are empty."""
+        missing = [field for field in REQUIRED_FIELDS if not self[field]]
+        for field in missing:
+            if index is None:
+                logging.warning(f"Entry '{self.title}' missing required field: {field}")
+            else:
+                logging.warning(f"Entry #{index} missing required field: {field}")
+        return missing
+
+    def __getitem__(self, field):
+        try:
+            value = getattr(self, self.FIELDS[field])
+        except KeyError:
+            raise KeyError(field) from None
+        if field == "Key Aspects":
+            return "\n".join("- " + point for point in value)
+        return value
+
+    def get(self, field, default=None):
+        try:
+            return self[field]
+        except KeyError:
+            return default
+
+    def __contains__(self, field):
+        return field in self.FIELDS
+
+    def to_dict(self):
+        return {field: self[field] for field in self.FIELDS}
+
+    def __eq__(self, other):
+        if not isinstance(other, Entry):
+            return NotImplemented
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.__slots__)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Entry(title={self.title!r}, date={self.date!r}, country={self.country!r})"
 
-    # Prepare Title split for two lines max
-    title = entry["Title"]
-    if len(title) > 40:
-        parts = title.split(' ')
-        mid = len(parts) // 2
-        title_text = ' '.join(parts[:mid]) + '\n' + ' '.join(parts[mid:])
-    else:
-        title_text = title
+
+def as_entry(entry, index=None):
+    """Return ``entry`` as an Entry, converting (and validating) dict input."""
+    if isinstance(entry, Entry):
+        return entry
+    return Entry.from_dict(entry, index)
+
+
+# --- Multi-source merge ---
+DATE_FORMATS = ["%Y-%m-%d", "%d/%m/%Y", "%d.%m.%Y", "%d %B %Y", "%B %d, %Y"]
+
+
+def _normalise(value):
+    return " ".join(value.split()).casefold()
+
+
+def entry_key(entry):
+    """Hash an entry on its normalised Title, Date, Country and Link."""
+    link = _normalise(entry.link).rstrip("/")
+    key = "\x1f".join([_normalise(entry.title), _normalise(entry.date),
+                       _normalise(entry.country), link])
+    return hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+
+
+def _date_sort_key(entry):
+    for date_format in DATE_FORMATS:
+        try:
+            return (0, datetime.strptime(entry.date, date_format), entry.title)
+        except ValueError:
+            continue
+    # Unparseable dates sort last, in text order
+    return (1, entry.date, entry.title)
+
+
+SORT_KEYS = {
+    "date": _date_sort_key,
+    "country": lambda entry: (entry.country.casefold(), _date_sort_key(entry)),
+}
+
+
+def merge_entries(sources, sort_by=None):
+    """
+    Merge entries from several sources, keeping the first of any duplicates.
+
+    ``sources`` is an iterable of entry iterables and is consumed lazily, so
+    each source can be parsed only when it is reached. Returns the merged
+    entries and the number of duplicates removed.
+    """
+    seen = set()
+    merged = []
+    duplicates = 0
+    for source in sources:
+        for entry in source:
+            entry = as_entry(entry)
+            key = entry_key(entry)
+            if key in seen:
+                duplicates += 1
+                continue
+            seen.add(key)
+            merged.append(entry)
+    if sort_by is not None:
+        merged.sort(key=SORT_KEYS[sort_by])
+    print(f"[merge_entries] Merged {len(merged)} entries, "
+          f"removed {duplicates} duplicates")
+    return merged, duplicates
+
+
+def build_table_for_entry(entry, shared_chrome=False):
+    """
+    Build the PDF table for one entry.
+    With ``shared_chrome`` the fixed label cells and backgrounds are drawn
+    from form XObjects shared across the document (see EntryTable).
+    """
+    entry = as_entry(entry)
+    print(
+        f"[build_table_for_entry] Building table for entry: {entry.title}")
 
     # Prepare flag image if exists
-    flag_path = country_flags.get(entry["Country"])
+    flag_path = country_flags.get(entry.country)
     flag_img = None
     if flag_path and os.path.isfile(flag_path):
         try:
-            if entry["Country"] == "Switzerland":
+            if entry.country == "Switzerland":
                 # Square flag for Switzerland
                 flag_img = Image(flag_path,
                                  width=0.5 * inch,
@@ -161,7 +597,7 @@ def build_table_for_entry(entry):
             flag_img = None
     else:
         print(
-            f"  No flag image found for country '{entry['Country']}' at '{flag_path}'"
+            f"  No flag image found for country '{entry.country}' at '{flag_path}'"
         )
 
     # Wrap flag image in a Table cell for centering
@@ -179,26 +615,18 @@ def build_table_for_entry(entry):
                 ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
             ]))
 
-    # Increase font leading for multiline wrapping text to avoid overlap
-    summary_style = ParagraphStyle(
-        'SummaryStyle',
-        parent=value_style,
-        leading=16,
-    )
-
     # Compose summary with key aspects
-    summary_text = entry.get('Summary', '') or ''
-    summary_flowables = [Paragraph(summary_text, summary_style)]
+    summary_flowables = [CachedParagraph(entry.summary, summary_style)]
 
-    key_aspects_list = tokenize_key_aspects(entry.get("Key Aspects", ""))
     bullet_items = [
-        ListItem(Paragraph(point, value_style)) for point in key_aspects_list
-        if point
+        ListItem(CachedParagraph(point, value_style))
+        for point in entry.key_aspects if point
     ]
 
     if bullet_items:
         summary_flowables.append(Spacer(1, 6))
-        summary_flowables.append(Paragraph('<b>Key Aspects:</b>', value_style))
+        summary_flowables.append(
+            CachedParagraph('<b>Key Aspects:</b>', value_style))
         summary_flowables.append(
             ListFlowable(bullet_items, bulletType='bullet', leftIndent=12))
 
@@ -210,24 +638,26 @@ def build_table_for_entry(entry):
     # Table data (6 columns)
     data = [
         [
-            Paragraph('<b>Title</b>', label_style),
-            Paragraph(title_text, value_style),
-            Paragraph('<b>Date</b>', label_style),
-            Paragraph(entry['Date'], value_style),
-            Paragraph('<b>Country</b>', label_style),
-            flag_img if flag_img else Paragraph(entry['Country'], value_style)
+            CachedParagraph('<b>Title</b>', label_style),
+            CachedParagraph(entry.display_title, value_style),
+            CachedParagraph('<b>Date</b>', label_style),
+            CachedParagraph(entry.date, value_style, field='Date'),
+            CachedParagraph('<b>Country</b>', label_style),
+            flag_img
+            if flag_img else CachedParagraph(entry.country, value_style)
         ],
         [
-            Paragraph('<b>Summary</b>', label_style), summary_cell_content, '',
-            '', '', ''
+            CachedParagraph('<b>Summary</b>', label_style),
+            summary_cell_content, '', '', '', ''
         ],
         [
-            Paragraph('<b>Link</b>', label_style),
-            Paragraph(entry['Link'], value_style), '', '', '', ''
+            CachedParagraph('<b>Link</b>', label_style),
+            CachedParagraph(entry.link, value_style), '', '', '', ''
         ],
         [
-            Paragraph('<b>Availability</b>', label_style),
-            Paragraph(entry['Availability'], value_style), '', '', '', ''
+            CachedParagraph('<b>Availability</b>', label_style),
+            CachedParagraph(entry.availability, value_style,
+                            field='Availability'), '', '', '', ''
         ],
     ]
 
@@ -240,61 +670,152 @@ def build_table_for_entry(entry):
         base_height * 3  # Availability row
     ]
 
-    # --- Modern semi-transparent border color ---
-    semi_transparent_border = colors.Color(87 / 255, 155 / 255, 156 / 255,
-                                           0.4)  # RGBA
-
-    t = Table(data,
-              colWidths=[
-                  1 * inch, 2.5 * inch, 0.8 * inch, 1 * inch, 0.8 * inch,
-                  1 * inch
-              ],
-              rowHeights=row_heights)
-    style = TableStyle([
-        # Modern semi-transparent borders
-        ('BOX', (0, 0), (-1, -1), 1, semi_transparent_border),
-        ('INNERGRID', (0, 0), (-1, -1), 1, semi_transparent_border),
-        # Label backgrounds (solid)
-        ('BACKGROUND', (0, 0), (0, 0), one_consult_blue),
-        ('BACKGROUND', (2, 0), (2, 0), one_consult_blue),
-        ('BACKGROUND', (4, 0), (4, 0), one_consult_blue),
-        ('BACKGROUND', (0, 1), (0, 1), one_consult_blue),
-        ('BACKGROUND', (0, 2), (0, 2), one_consult_blue),
-        ('BACKGROUND', (0, 3), (0, 3), one_consult_blue),
-        # Content backgrounds (transparent)
-        ('BACKGROUND', (1, 0), (1, 0), transparent_blue),
-        ('BACKGROUND', (3, 0), (3, 0), transparent_blue),
-        ('BACKGROUND', (5, 0), (5, 0), transparent_blue),
-        ('BACKGROUND', (1, 1), (-1, 1), transparent_blue),
-        ('BACKGROUND', (1, 2), (-1, 2), transparent_blue),
-        ('BACKGROUND', (1, 3), (-1, 3), transparent_blue),
-        ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('ALIGN', (1, 0), (1, 0), 'LEFT'),
-        ('ALIGN', (1, 1), (1, 3), 'LEFT'),
-        ('ALIGN', (5, 0), (5, 0), 'CENTER'),
-        ('SPAN', (1, 1), (-1, 1)),
-        ('SPAN', (1, 2), (-1, 2)),
-        ('SPAN', (1, 3), (-1, 3)),
-    ])
-    t.setStyle(style)
-
-    print(f"  Table built for entry: {entry['Title']}")
+    if shared_chrome:
+        t = EntryTable(data,
+                       colWidths=PDF_ENTRY_COL_WIDTHS,
+                       rowHeights=row_heights,
+                       commands=PDF_ENTRY_TABLE_COMMANDS)
+    else:
+        t = Table(data,
+                  colWidths=PDF_ENTRY_COL_WIDTHS,
+                  rowHeights=row_heights)
+        t.setStyle(TableStyle(PDF_ENTRY_TABLE_COMMANDS))
+
+    print(f"  Table built for entry: {entry.title}")
     return t
 
 
-def set_cell_background(cell, color_hex):
-    if color_hex is None:
-        return
-    shading_elm = parse_xml(r'<w:shd {} w:fill="{}"/>'.format(
-        nsdecls('w'), color_hex))
-    tc_pr = cell._tc.get_or_add_tcPr()
-    # Remove existing shading if any
-    for child in tc_pr.findall(
-            '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}shd'
-    ):
-        tc_pr.remove(child)
-    tc_pr.append(shading_elm)
+# --- PDF entry table layout ---
+PDF_ENTRY_COL_WIDTHS = [
+    1 * inch, 2.5 * inch, 0.8 * inch, 1 * inch, 0.8 * inch, 1 * inch
+]
+
+# --- Modern semi-transparent border color ---
+semi_transparent_border = colors.Color(87 / 255, 155 / 255, 156 / 255,
+                                       0.4)  # RGBA
+
+PDF_ENTRY_TABLE_COMMANDS = [
+    # Modern semi-transparent borders
+    ('BOX', (0, 0), (-1, -1), 1, semi_transparent_border),
+    ('INNERGRID', (0, 0), (-1, -1), 1, semi_transparent_border),
+    # Label backgrounds (solid)
+    ('BACKGROUND', (0, 0), (0, 0), one_consult_blue),
+    ('BACKGROUND', (2, 0), (2, 0), one_consult_blue),
+    ('BACKGROUND', (4, 0), (4, 0), one_consult_blue),
+    ('BACKGROUND', (0, 1), (0, 1), one_consult_blue),
+    ('BACKGROUND', (0, 2), (0, 2), one_consult_blue),
+    ('BACKGROUND', (0, 3), (0, 3), one_consult_blue),
+    # Content backgrounds (transparent)
+    ('BACKGROUND', (1, 0), (1, 0), transparent_blue),
+    ('BACKGROUND', (3, 0), (3, 0), transparent_blue),
+    ('BACKGROUND', (5, 0), (5, 0), transparent_blue),
+    ('BACKGROUND', (1, 1), (-1, 1), transparent_blue),
+    ('BACKGROUND', (1, 2), (-1, 2), transparent_blue),
+    ('BACKGROUND', (1, 3), (-1, 3), transparent_blue),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('ALIGN', (1, 0), (1, 0), 'LEFT'),
+    ('ALIGN', (1, 1), (1, 3), 'LEFT'),
+    ('ALIGN', (5, 0), (5, 0), 'CENTER'),
+    ('SPAN', (1, 1), (-1, 1)),
+    ('SPAN', (1, 2), (-1, 2)),
+    ('SPAN', (1, 3), (-1, 3)),
+]
+
+# Fixed-height rows whose chrome is the same in every entry table:
+# (form name, first row, last row)
+PDF_CHROME_BANDS = [
+    ("EntryChromeTop", 0, 0),
+    ("EntryChromeBottom", 2, 3),
+]
+
+# Band tables are identical for every entry, so build them once
+_pdf_chrome_tables = {}
+
+
+def _clip_commands(commands, first_row, last_row, nrows):
+    """Clip table style commands to rows first_row..last_row, re-indexed from 0."""
+    clipped = []
+    for name, (c0, r0), (c1, r1), *args in commands:
+        r0, r1 = r0 % nrows, r1 % nrows
+        if r1 < first_row or r0 > last_row:
+            continue
+        clipped.append((name, (c0, max(r0, first_row) - first_row),
+                        (c1, min(r1, last_row) - first_row), *args))
+    return clipped
+
+
+class EntryTable(Table):
+    """
+    Entry table whose fixed-height labels are drawn from shared form XObjects.
+
+    The label cells of the Title, Link and Availability rows are the same in
+    every entry, so they are drawn once per document into a form per band
+    (PDF_CHROME_BANDS) and referenced from every page. Backgrounds, values
+    and borders are drawn as usual, before the forms, and the labels overlap
+    none of them, so the result is identical to a plain Table. A table too
+    tall for the page is split as a plain Table, since the forms cover whole
+    bands.
+    """
+
+    def __init__(self, data, colWidths, rowHeights, commands, **kwargs):
+        self._plain = (data, colWidths, rowHeights, commands)
+        data = [list(row) for row in data]
+        in_band = set()
+        for name, first_row, last_row in PDF_CHROME_BANDS:
+            if name not in _pdf_chrome_tables:
+                _pdf_chrome_tables[name] = self._band_table(
+                    data, colWidths, rowHeights, commands, first_row,
+                    last_row)
+            in_band.update(range(first_row, last_row + 1))
+        for row in in_band:
+            for col, value in enumerate(data[row]):
+                if _is_label(value):
+                    data[row][col] = ''
+        Table.__init__(self, data, colWidths=colWidths, rowHeights=rowHeights,
+                       **kwargs)
+        self.setStyle(TableStyle(commands))
+
+    def split(self, availWidth, availHeight):
+        data, colWidths, rowHeights, commands = self._plain
+        table = Table(data, colWidths=colWidths, rowHeights=rowHeights)
+        table.setStyle(TableStyle(commands))
+        return table.split(availWidth, availHeight)
+
+    @staticmethod
+    def _band_table(data, colWidths, rowHeights, commands, first_row,
+                    last_row):
+        rows = [[value if _is_label(value) else '' for value in row]
+                for row in data[first_row:last_row + 1]]
+        band_commands = [
+            command for command in _clip_commands(commands, first_row,
+                                                  last_row, len(data))
+            if command[0] in ('ALIGN', 'VALIGN', 'SPAN')
+        ]
+        band = Table(rows,
+                     colWidths=colWidths,
+                     rowHeights=rowHeights[first_row:last_row + 1])
+        band.setStyle(TableStyle(band_commands))
+        return band
+
+    def draw(self):
+        Table.draw(self)
+        canv = self.canv
+        for name, first_row, last_row in PDF_CHROME_BANDS:
+            band = _pdf_chrome_tables[name]
+            width, height = band.wrapOn(canv, self._width, self._height)
+            if not canv.hasForm(name):
+                canv.beginForm(name, 0, 0, width, height)
+                band.drawOn(canv, 0, 0)
+                canv.endForm()
+            canv.saveState()
+            canv.translate(0, self._rowpositions[last_row + 1])
+            canv.doForm(name)
+            canv.restoreState()
+
+
+def _is_label(value):
+    return isinstance(value, Paragraph) and value.style is label_style
 
 
 def clear_cell(cell):
@@ -323,6 +844,19 @@ def add_flag_to_cell(cell, flag_path):
     cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
 
 
+# Space between entries in dense pagination mode, in points
+DEFAULT_ENTRY_GAP = 0.2 * inch
+# Word needs a paragraph between tables to keep them apart, and an exact
+# line height of 0pt is not a usable spacing, so dense gaps are at least 1pt
+MIN_WORD_ENTRY_GAP = 1
+
+
+def check_gap(gap):
+    """Raise ValueError for a negative inter-entry gap."""
+    if gap < 0:
+        raise ValueError(f"Entry gap must not be negative, got {gap}")
+    return gap
+
 # --- Table structure configuration ---
 TABLE_COLUMNS = [
     ("Title", 1),
@@ -334,60 +868,130 @@ TABLE_COLUMNS = [
 ]
 
 
-def create_word(entries, output_docx):
+# --- Entry table style ---
+ENTRY_TABLE_STYLE = "One Consulting Entry"
+DENSE_ENTRY_TABLE_STYLE = "One Consulting Entry Dense"
+LABEL_FILL = "579B9C"  # one_consult_blue
+VALUE_FILL = "E2F3F3"  # transparent_blue
+BORDER_COLOR = "B3E0E2"  # Light blue (matches the blue, but lighter)
+
+
+def add_entry_table_style(doc, dense=False):
+    """
+    Define the One Consulting entry table look once in styles.xml.
+
+    Borders, centring, vertical alignment and the value shading apply to the
+    whole table; the first column and the alternating label columns of the
+    header row get the label shading through conditional formatting. The
+    header row is expressed with vertical banding because a firstRow
+    condition would also shade its value cells. With the first column
+    enabled, Word starts banding at grid column 1, so band1Vert is the
+    value columns (1, 3, 5) and band2Vert the label columns (2, 4).
+
+    The dense variant also keeps every paragraph with the next and forbids
+    row splits, so a table is never broken across pages.
+    """
+    name = DENSE_ENTRY_TABLE_STYLE if dense else ENTRY_TABLE_STYLE
+    styles = doc.styles
+    if name in [s.name for s in styles]:
+        return styles[name]
+    border = ('w:val="single" w:sz="6" w:space="0" w:color="{}"'.format(
+        BORDER_COLOR))
+    label_shading = ('<w:shd w:val="clear" w:color="auto" w:fill="{}"/>'.
+                     format(LABEL_FILL))
+    value_shading = ('<w:shd w:val="clear" w:color="auto" w:fill="{}"/>'.
+                     format(VALUE_FILL))
+    style_xml = (
+        '<w:style {ns} w:type="table" w:customStyle="1" '
+        'w:styleId="{style_id}">'
+        '<w:name w:val="{name}"/>'
+        '<w:basedOn w:val="TableNormal"/>'
+        '{keep_ppr}'
+        '<w:tblPr>'
+        '<w:tblStyleColBandSize w:val="1"/>'
+        '<w:jc w:val="center"/>'
+        '<w:tblBorders>'
+        '<w:top {b}/><w:left {b}/><w:bottom {b}/><w:right {b}/>'
+        '<w:insideH {b}/><w:insideV {b}/>'
+        '</w:tblBorders>'
+        '</w:tblPr>'
+        '{keep_trpr}'
+        '<w:tcPr>{value}<w:vAlign w:val="center"/></w:tcPr>'
+        '<w:tblStylePr w:type="firstCol">'
+        '<w:rPr><w:b/><w:bCs/></w:rPr><w:tcPr>{label}</w:tcPr>'
+        '</w:tblStylePr>'
+        '<w:tblStylePr w:type="band1Vert"><w:tcPr>{value}</w:tcPr>'
+        '</w:tblStylePr>'
+        '<w:tblStylePr w:type="band2Vert"><w:tcPr>{label}</w:tcPr>'
+        '</w:tblStylePr>'
+        '</w:style>').format(
+            ns=nsdecls('w'),
+            style_id=name.replace(' ', ''),
+            name=name,
+            keep_ppr='<w:pPr><w:keepNext/></w:pPr>' if dense else '',
+            keep_trpr='<w:trPr><w:cantSplit/></w:trPr>' if dense else '',
+            b=border,
+            label=label_shading,
+            value=value_shading)
+    styles.element.append(parse_xml(style_xml))
+    return styles[name]
+
+
+def use_entry_table_look(table):
+    """Enable the first column and column banding conditions of the table style."""
+    tbl_pr = table._tbl.tblPr
+    tbl_look = tbl_pr.find(qn('w:tblLook'))
+    if tbl_look is None:
+        tbl_look = parse_xml('<w:tblLook {}/>'.format(nsdecls('w')))
+        tbl_pr.append(tbl_look)
+    tbl_look.set(qn('w:val'), '0280')
+    tbl_look.set(qn('w:firstRow'), '0')
+    tbl_look.set(qn('w:lastRow'), '0')
+    tbl_look.set(qn('w:firstColumn'), '1')
+    tbl_look.set(qn('w:lastColumn'), '0')
+    tbl_look.set(qn('w:noHBand'), '1')
+    tbl_look.set(qn('w:noVBand'), '0')
+
+
+def create_word(entries, output_docx, dense=False, gap=DEFAULT_ENTRY_GAP):
     """
     Generate a Word document with a table for each entry.
     Each table contains Title, Date, Country, Summary, Link, and Availability.
+    Entries may be Entry records or dicts keyed by field name.
+    By default each table starts a new page; with ``dense`` as many whole
+    tables as fit share a page, separated by ``gap`` points (at least
+    ``MIN_WORD_ENTRY_GAP``). Word lays out the pages when the document is
+    opened, so only the output size is reported.
     """
+    check_gap(gap)
     logging.basicConfig(level=logging.INFO)
     logging.info("[create_word] Creating Word document: %s", output_docx)
     doc = DocxDocument()
+    table_style = add_entry_table_style(doc, dense)
 
     for i, entry in enumerate(entries, 1):
         logging.info("[create_word] Processing entry #%d", i)
-
-        # --- Validate input data ---
-        required_fields = ["Title", "Date", "Country", "Summary", "Link", "Availability"]
-        for field in required_fields:
-            if field not in entry or not entry[field]:
-                logging.warning(f"Entry #{i} missing required field: {field}")
+        entry = as_entry(entry, i)
 
         # --- Table creation using parameterized structure ---
         table = doc.add_table(rows=4, cols=len(TABLE_COLUMNS))
-        table.alignment = WD_TABLE_ALIGNMENT.CENTER
+        table.style = table_style
+        use_entry_table_look(table)
         table.autofit = False
         for idx, (_, width) in enumerate(TABLE_COLUMNS):
             for cell in table.columns[idx].cells:
                 cell.width = Inches(width)
 
-        # Prepare Title split
-        title = entry.get("Title", "")
-        if len(title) > 40:
-            parts = title.split(' ')
-            mid = len(parts) // 2
-            title_text = ' '.join(parts[:mid]) + '\n' + ' '.join(parts[mid:])
-        else:
-            title_text = title
-
-        # Row 1
+        # Row 1 (label/value shading comes from the table style)
         cells = [
             (table.cell(0, 0), "Title"),
-            (table.cell(0, 1), title_text),
+            (table.cell(0, 1), entry.display_title),
             (table.cell(0, 2), "Date"),
-            (table.cell(0, 3), entry.get("Date", "")),
+            (table.cell(0, 3), entry.date),
             (table.cell(0, 4), "Country"),
-            (table.cell(0, 5), None),  # Flag or country text filled later
         ]
-
-        # Set backgrounds for label/content fields in Row 1
-        for idx, (cell, text) in enumerate(cells):
-            if text in ["Title", "Date", "Country"]:
-                set_cell_background(cell, "579B9C")  # one_consult_blue
-            else:
-                set_cell_background(cell, "E2F3F3")  # transparent_blue
-            if text is not None:
-                cell.text = text
-            cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+        for cell, text in cells:
+            cell.text = text
 
         # Make labels bold (in label cells)
         for idx in [0, 2, 4]:
@@ -395,141 +999,195 @@ def create_word(entries, output_docx):
 
         # Add flag or country text centered in last cell
         country_cell_value = table.cell(0, 5)
-        flag_path = country_flags.get(entry.get("Country", ""))
+        flag_path = country_flags.get(entry.country)
         if flag_path and os.path.isfile(flag_path):
             add_flag_to_cell(country_cell_value, flag_path)
         else:
             if flag_path:
-                logging.warning(f"Flag image not found for '{entry.get('Country', '')}' at '{flag_path}'")
-            country_cell_value.text = entry.get("Country", "")
-            country_cell_value.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+                logging.warning(f"Flag image not found for '{entry.country}' at '{flag_path}'")
+            country_cell_value.text = entry.country
 
         # Row 2 Summary
         summary_label_cell = table.cell(1, 0)
         summary_label_cell.text = "Summary"
-        set_cell_background(summary_label_cell, "579B9C")  # one_consult_blue
         set_bold(summary_label_cell)
-        summary_label_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
 
         summary_value_cell = table.cell(1, 1)
         clear_cell(summary_value_cell)
-        set_cell_background(summary_value_cell, "E2F3F3")  # transparent_blue
-        summary_text = entry.get("Summary", "").strip()
-        p = summary_value_cell.add_paragraph(summary_text)
+        p = summary_value_cell.add_paragraph(entry.summary)
         p.paragraph_format.space_after = Pt(6)
-        key_aspects_list = tokenize_key_aspects(entry.get("Key Aspects", ""))
-        if key_aspects_list:
+        if entry.key_aspects:
             p = summary_value_cell.add_paragraph()
             run = p.add_run("Key Aspects:")
             run.bold = True
-            for point in key_aspects_list:
+            for point in entry.key_aspects:
                 bullet = summary_value_cell.add_paragraph(point,
                                                           style='List Bullet')
                 bullet.paragraph_format.left_indent = Pt(18)
-        summary_value_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        for col in range(2, 6):
-            cell = table.cell(1, col)
-            set_cell_background(cell, "E2F3F3")  # transparent_blue
-            summary_value_cell.merge(cell)
+        summary_value_cell.merge(table.cell(1, 5))
 
         # Row 3 Link
         link_label_cell = table.cell(2, 0)
         link_label_cell.text = "Link"
-        set_cell_background(link_label_cell, "579B9C")  # one_consult_blue
-        link_label_cell.paragraphs[0].runs[0].font.bold = True
-        link_label_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+        set_bold(link_label_cell)
 
         link_value_cell = table.cell(2, 1)
-        link_value_cell.text = entry.get("Link", "")
-        set_cell_background(link_value_cell, "E2F3F3")  # transparent_blue
-        link_value_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        for col in range(2, 6):
-            cell = table.cell(2, col)
-            set_cell_background(cell, "E2F3F3")  # transparent_blue
-            link_value_cell.merge(cell)
+        link_value_cell.text = entry.link
+        link_value_cell.merge(table.cell(2, 5))
 
         # Row 4 Availability
         avail_label_cell = table.cell(3, 0)
         avail_label_cell.text = "Availability"
-        set_cell_background(avail_label_cell, "579B9C")  # one_consult_blue
-        avail_label_cell.paragraphs[0].runs[0].font.bold = True
-        avail_label_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
+        set_bold(avail_label_cell)
 
         avail_value_cell = table.cell(3, 1)
-        avail_value_cell.text = entry.get("Availability", "")
-        set_cell_background(avail_value_cell, "E2F3F3")  # transparent_blue
-        avail_value_cell.vertical_alignment = WD_ALIGN_VERTICAL.CENTER
-        for col in range(2, 6):
-            cell = table.cell(3, col)
-            set_cell_background(cell, "E2F3F3")  # transparent_blue
-            avail_value_cell.merge(cell)
+        avail_value_cell.text = entry.availability
+        avail_value_cell.merge(table.cell(3, 5))
 
         # Set fixed height for the first row
         table.rows[0].height = Inches(0.6)
         table.rows[0].height_rule = WD_ROW_HEIGHT_RULE.EXACTLY
 
-        # --- Add modern light blue borders to all cells ---
-        border_color = "B3E0E2"  # Light blue hex (matches the blue, but lighter)
-        for row in table.rows:
-            for cell in row.cells:
-                tc = cell._tc
-                tcPr = tc.get_or_add_tcPr()
-                for border_name in ['top', 'left', 'bottom', 'right']:
-                    border_tag = f'w:{border_name}'
-                    border = tcPr.find(
-                        f'.//{border_tag}',
-                        namespaces={
-                            'w':
-                            'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
-                        })
-                    if border is None:
-                        from docx.oxml import OxmlElement
-                        border = OxmlElement(border_tag)
-                        tcPr.append(border)
-                    border.set(qn('w:val'), 'single')
-                    border.set(qn('w:sz'), '6')  # Thin border
-                    border.set(qn('w:color'), border_color)
-                    border.set(qn('w:space'), '0')
-
-        # Add page break after each table except last
+        # Add page break (or the dense gap) after each table except last
         if i != len(entries):
             p = doc.add_paragraph()
-            run = p.add_run()
-            run.add_break(WD_BREAK.PAGE)
+            if dense:
+                p.paragraph_format.space_before = Pt(0)
+                p.paragraph_format.space_after = Pt(0)
+                p.paragraph_format.line_spacing = Pt(
+                    max(gap, MIN_WORD_ENTRY_GAP))
+            else:
+                run = p.add_run()
+                run.add_break(WD_BREAK.PAGE)
 
     # --- Error handling for file operations ---
     try:
         doc.save(output_docx)
         print("[create_word] Document saved successfully.")
+        print(f"[create_word] {len(entries)} entries, "
+              f"{os.path.getsize(output_docx)} bytes written")
     except Exception as e:
         logging.error(f"Failed to save Word document '{output_docx}': {e}")
 
 
-def create_pdf(entries, output_pdf):
+def create_pdf(entries,
+               output_pdf,
+               dense=False,
+               gap=DEFAULT_ENTRY_GAP,
+               optimize=False):
+    """
+    Generate a PDF with a table for each entry.
+    By default each table starts a new page; with ``dense`` as many whole
+    tables as fit share a page, separated by ``gap`` points. With
+    ``optimize`` content streams are Flate-compressed without the ASCII85
+    layer, the table labels come from shared form XObjects, and the
+    document is built in memory and written with a single write, whose
+    throughput is reported; the rendered pages are the same. Returns the
+    number of pages written.
+    """
+    check_gap(gap)
     print("[create_pdf] Creating PDF document:", output_pdf)
-    doc = SimpleDocTemplate(output_pdf,
+    # The cache outlives this document; report only this render's lookups
+    start_fields = text_layout_cache.stats()['fields']
+    buffer = io.BytesIO() if optimize else None
+    doc = SimpleDocTemplate(buffer if optimize else output_pdf,
                             pagesize=A4,
                             rightMargin=36,
                             leftMargin=36,
                             topMargin=36,
-                            bottomMargin=36)
+                            bottomMargin=36,
+                            pageCompression=1 if optimize else None)
 
     elements = []
 
     for i, entry in enumerate(entries, 1):
-        elements.append(build_table_for_entry(entry))
-        if i != len(entries):
-            elements.append(Spacer(1, 0.2 * inch))
-            elements.append(PageBreak())
+        table = build_table_for_entry(entry, shared_chrome=optimize)
+        if dense:
+            # Move the whole table to the next page rather than split it
+            elements.append(KeepTogether([table]))
+            if i != len(entries):
+                elements.append(Spacer(1, gap))
+        else:
+            elements.append(table)
+            if i != len(entries):
+                elements.append(Spacer(1, 0.2 * inch))
+                elements.append(PageBreak())
 
-    doc.build(elements)
+    use_a85 = rl_config.useA85
+    try:
+        if optimize:
+            # ASCII85 only makes binary streams printable, at ~25% size cost
+            rl_config.useA85 = 0
+        doc.build(elements)
+    finally:
+        rl_config.useA85 = use_a85
+    if optimize:
+        # The output file is only created once the whole PDF exists
+        start = time.perf_counter()
+        with open(output_pdf, 'wb') as f:
+            f.write(buffer.getbuffer())
+        write_time = time.perf_counter() - start
     print("[create_pdf] PDF saved successfully.")
+    pages = doc.page
+    size = os.path.getsize(output_pdf)
+    if dense:
+        # One entry per page needs a page per entry, more if a table overflows
+        print(f"[create_pdf] {pages} pages for {len(entries)} entries, "
+              f"saving at least {max(len(entries) - pages, 0)} pages over one "
+              f"entry per page; {size} bytes written")
+    else:
+        print(f"[create_pdf] {pages} pages for {len(entries)} entries")
+    if optimize:
+        print(f"[create_pdf] {size} bytes, "
+              f"{size / max(pages, 1):.0f} bytes/page, "
+              f"written at {size / max(write_time, 1e-9) / 2**20:.1f} MiB/s")
+    stats = text_layout_cache.stats()
+    rates = []
+    for field, (hits, misses) in stats['fields'].items():
+        start_hits, start_misses = start_fields.get(field, (0, 0))
+        hits -= start_hits
+        misses -= start_misses
+        if hits + misses:
+            rates.append(f"{field} {hits / (hits + misses):.1%} "
+                         f"({hits} hits, {misses} misses)")
+    print(f"[create_pdf] Text layout cache hit rate: "
+          f"{', '.join(rates) or 'no lookups'}; "
+          f"{stats['size']}/{stats['maxsize']} entries")
+    return pages
+
+
+def non_negative_float(value):
+    """argparse type for options such as --gap that cannot be negative."""
+    try:
+        return check_gap(float(value))
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
+def ignored_options(args):
+    """Return (option, reason) pairs for options that have no effect."""
+    if args.check:
+        used = [('--word', args.word), ('--dense', args.dense),
+                ('--gap', args.gap is not None),
+                ('--optimize-pdf', args.optimize_pdf),
+                ('--sort', args.sort is not None)]
+        return [(option, 'with --check') for option, set_ in used if set_]
+    ignored = []
+    if args.jobs is not None:
+        ignored.append(('--jobs', 'without --check'))
+    if args.gap is not None and not args.dense:
+        ignored.append(('--gap', 'without --dense'))
+    if args.optimize_pdf and args.word:
+        ignored.append(('--optimize-pdf', 'with --word'))
+    return ignored
 
 
 def main():
     parser = argparse.ArgumentParser(
         description='Generate report from Word to PDF or Word.')
-    parser.add_argument('input_docx', help='Input DOCX file with entries')
+    parser.add_argument('input_docx',
+                        nargs='+',
+                        help='Input DOCX file(s) with entries')
     parser.add_argument('-o',
                         '--output',
                         default='output.pdf',
@@ -538,9 +1196,51 @@ def main():
                         '--word',
                         action='store_true',
                         help='Create a Word document instead of PDF')
+    parser.add_argument('--check',
+                        action='store_true',
+                        help='Only parse the inputs and print diagnostics '
+                        'as JSON; exit non-zero if any entry is malformed')
+    parser.add_argument('-j',
+                        '--jobs',
+                        type=int,
+                        default=None,
+                        help='Worker processes for --check '
+                        '(default: one per CPU)')
+    parser.add_argument('--dense',
+                        action='store_true',
+                        help='Fit as many whole entry tables per page as '
+                        'possible instead of one entry per page')
+    parser.add_argument('--gap',
+                        type=non_negative_float,
+                        default=None,
+                        help='Space between entries in points with --dense '
+                        f'(default: {DEFAULT_ENTRY_GAP:g})')
+    parser.add_argument('--optimize-pdf',
+                        action='store_true',
+                        help='Write a smaller PDF: compressed streams without '
+                        'ASCII85 and shared table labels')
+    parser.add_argument('--sort',
+                        choices=sorted(SORT_KEYS),
+                        default=None,
+                        help='Sort the merged entries by date or country')
     args = parser.parse_args()
 
-    entries = parse_docx(args.input_docx)
+    for option, reason in ignored_options(args):
+        logging.warning("%s has no effect %s and is ignored", option, reason)
+    gap = DEFAULT_ENTRY_GAP if args.gap is None else args.gap
+
+    if args.check:
+        report = check_files(args.input_docx, jobs=args.jobs)
+        print(json.dumps(report, indent=2))
+        sys.exit(0 if report["ok"] else 1)
+
+    if len(args.input_docx) > 1 or args.sort:
+        # Merge inputs, dropping publications that appear in several of them
+        entries, _ = merge_entries(
+            (parse_docx(path) for path in args.input_docx),
+            sort_by=args.sort)
+    else:
+        entries = parse_docx(args.input_docx[0])
 
     if args.word:
         # Force output to .docx extension if not provided
@@ -548,14 +1248,18 @@ def main():
             output_docx = os.path.splitext(args.output)[0] + '.docx'
         else:
             output_docx = args.output
-        create_word(entries, output_docx)
+        create_word(entries, output_docx, dense=args.dense, gap=gap)
     else:
         # Force output to .pdf extension if not provided
         if not args.output.lower().endswith('.pdf'):
             output_pdf = os.path.splitext(args.output)[0] + '.pdf'
         else:
             output_pdf = args.output
-        create_pdf(entries, output_pdf)
+        create_pdf(entries,
+                   output_pdf,
+                   dense=args.dense,
+                   gap=gap,
+                   optimize=args.optimize_pdf)
 
 
 if __name__ == "__main__":
@@ -3,7 +3,14 @@ import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 import unittest
-from generate_reports import tokenize_key_aspects, parse_docx, create_word
+from generate_reports import (tokenize_key_aspects, parse_docx, create_word,
+                              split_title, TextLayoutCache, CachedParagraph,
+                              text_layout_cache, value_style,
+                              ENTRY_TABLE_STYLE, Entry, as_entry,
+                              build_table_for_entry, check_docx,
+                              check_files, merge_entries, entry_key,
+                              create_pdf, DENSE_ENTRY_TABLE_STYLE,
+                              MIN_WORD_ENTRY_GAP, ignored_options)
 from docx import Document as DocxDocument
 
 class TestGenerateReports(unittest.TestCase):
@@ -17,6 +24,115 @@ class TestGenerateReports(unittest.TestCase):
         s = "- Point 1\n- Point 2\n- Point 3"
         self.assertEqual(tokenize_key_aspects(s), ["Point 1", "Point 2", "Point 3"])
 
+    def test_split_title_short(self):
+        self.assertEqual(split_title("Short title"), "Short title")
+
+    def test_split_title_long(self):
+        title = "A rather long publication title that needs two lines"
+        self.assertEqual(split_title(title),
+                         "A rather long publication\ntitle that needs two lines")
+
+    def test_text_layout_cache_evicts_least_recently_used(self):
+        cache = TextLayoutCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("a"), 1)
+        self.assertEqual(cache.get("c"), 3)
+        self.assertEqual(cache.stats()["size"], 2)
+        self.assertAlmostEqual(cache.hit_rate, 3 / 4)
+
+    def test_text_layout_cache_disabled(self):
+        cache = TextLayoutCache(maxsize=0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.hit_rate, 0.0)
+
+    def test_cached_paragraph_reuses_layout(self):
+        text_layout_cache.clear()
+        first = CachedParagraph("Publicly available", value_style)
+        second = CachedParagraph("Publicly available", value_style)
+        self.assertIs(first.frags, second.frags)
+        self.assertEqual(first.wrap(100, 1000), second.wrap(100, 1000))
+        self.assertIs(first.blPara, second.blPara)
+        self.assertEqual(text_layout_cache.hits, 1)
+        self.assertEqual(text_layout_cache.misses, 1)
+
+    def test_cached_paragraph_wraps_each_width(self):
+        text_layout_cache.clear()
+        narrow = CachedParagraph("Publicly available online", value_style)
+        wide = CachedParagraph("Publicly available online", value_style)
+        self.assertGreater(narrow.wrap(40, 1000)[1], wide.wrap(400, 1000)[1])
+        self.assertEqual(len(narrow.blPara.lines), 3)
+        self.assertEqual(len(wide.blPara.lines), 1)
+
+    def test_text_layout_cache_counts_fields(self):
+        text_layout_cache.clear()
+        for _ in range(3):
+            CachedParagraph("<b>Date</b>", value_style)
+            CachedParagraph("2024-01-01", value_style, field="Date")
+        self.assertEqual(text_layout_cache.stats()["fields"], {"Date": (2, 1)})
+        self.assertEqual(text_layout_cache.hits, 4)
+
+    def test_entry_from_dict(self):
+        entry = Entry.from_dict({
+            "Title": "A rather long publication title that needs two lines",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": " This is a summary. ",
+            "Key Aspects": "- Aspect 1\n- Aspect 2",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        })
+        self.assertEqual(entry.key_aspects, ("Aspect 1", "Aspect 2"))
+        self.assertEqual(entry.display_title,
+                         "A rather long publication\ntitle that needs two lines")
+        self.assertEqual(entry.summary, "This is a summary.")
+        self.assertEqual(entry["Key Aspects"], "- Aspect 1\n- Aspect 2")
+        self.assertEqual(entry.get("Missing", "default"), "default")
+        self.assertFalse(hasattr(entry, "__dict__"))
+        self.assertEqual(Entry.from_dict(entry.to_dict()), entry)
+
+    def test_entry_validation_reports_missing_fields(self):
+        with self.assertLogs(level="WARNING") as logs:
+            entry = as_entry({"Title": "Test Entry", "Date": "2024-01-01"}, 3)
+        self.assertEqual(entry.country, "")
+        self.assertIn("Entry #3 missing required field: Country", logs.output[0])
+        self.assertIs(as_entry(entry), entry)
+
+    def test_build_table_accepts_entry_and_dict(self):
+        data = {
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Key Aspects": "- Aspect 1\n- Aspect 2",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }
+        from_dict = build_table_for_entry(data)
+        from_entry = build_table_for_entry(Entry.from_dict(data))
+        self.assertEqual(len(from_dict._cellvalues), len(from_entry._cellvalues))
+
+    def test_cached_paragraph_keys_on_style(self):
+        from reportlab.lib import colors
+        from reportlab.lib.styles import ParagraphStyle
+        text_layout_cache.clear()
+        red_style = ParagraphStyle('RedStyle', parent=value_style,
+                                   textColor=colors.red, alignment=2)
+        plain = CachedParagraph("Publicly available", value_style)
+        red = CachedParagraph("Publicly available", red_style)
+        plain.wrap(100, 1000)
+        red.wrap(100, 1000)
+        self.assertIsNot(plain.blPara, red.blPara)
+        self.assertEqual(text_layout_cache.misses, 2)
+
+    def test_cached_paragraph_without_room(self):
+        self.assertEqual(CachedParagraph("x", value_style).wrap(0, 100),
+                         (0, 0x7fffffff))
+
     def test_parse_docx(self):
         # Prepare a minimal DOCX file for testing
         from docx import Document
@@ -29,6 +145,64 @@ class TestGenerateReports(unittest.TestCase):
         self.assertEqual(len(entries), 1)
         self.assertEqual(entries[0]["Title"], "Test Entry")
         self.assertIn("Aspect 1", entries[0]["Key Aspects"])
+        self.assertEqual(entries[0].key_aspects, ("Aspect 1", "Aspect 2"))
+
+    def test_check_docx_reports_missing_and_misordered_fields(self):
+        from docx import Document
+        doc = Document()
+        for text in ["Title: Good", "Date: 2024-01-01", "Country: UK",
+                     "Summary: s", "Link: http://x", "Availability: Public",
+                     "Title: Swapped", "Country: UK", "Date: 2024-01-01",
+                     "Summary: s", "Link: http://x", "Availability: Public",
+                     "Title: No country", "Date: 2024-01-01", "Summary: s",
+                     "Link: http://x", "Availability: Public"]:
+            doc.add_paragraph(text)
+        test_docx = "test_check.docx"
+        doc.save(test_docx)
+        result = check_docx(test_docx)
+        os.remove(test_docx)
+        self.assertFalse(result["ok"])
+        self.assertEqual(result["entries"], 3)
+        self.assertEqual(result["valid"], 1)
+        self.assertEqual(result["errors"], [
+            {"entry": 3, "field": "Date", "problem": "misordered", "paragraph": 8},
+            {"entry": 4, "field": "Country", "problem": "missing", "paragraph": 12},
+        ])
+
+    def test_check_files_reports_unreadable_file(self):
+        report = check_files(["does_not_exist.docx"], jobs=1)
+        self.assertFalse(report["ok"])
+        self.assertIn("error", report["files"][0])
+
+    def test_merge_entries_drops_normalised_duplicates(self):
+        base = {
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "UK",
+            "Summary": "This is a summary.",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }
+        variant = dict(base, Title="test  entry", Link="http://example.com/",
+                       Summary="Another source's summary.")
+        later = dict(base, Title="Later Entry", Date="2024-03-01")
+        earlier = dict(base, Title="Earlier Entry", Date="15/01/2024",
+                       Country="Ireland")
+        merged, duplicates = merge_entries([[later, base], [variant, earlier]],
+                                           sort_by="date")
+        self.assertEqual(duplicates, 1)
+        self.assertEqual([e.title for e in merged],
+                         ["Test Entry", "Earlier Entry", "Later Entry"])
+        self.assertEqual(merged[0].summary, "This is a summary.")
+        self.assertEqual(entry_key(as_entry(base)), entry_key(as_entry(variant)))
+
+    def test_merge_entries_sort_by_country(self):
+        entries = [{"Title": t, "Date": "2024-01-01", "Country": c,
+                    "Summary": "s", "Link": t, "Availability": "Public"}
+                   for t, c in [("a", "UK"), ("b", "Ireland"), ("c", "Luxembourg")]]
+        merged, duplicates = merge_entries([entries], sort_by="country")
+        self.assertEqual(duplicates, 0)
+        self.assertEqual([e.country for e in merged], ["Ireland", "Luxembourg", "UK"])
 
     def test_create_word_end_to_end(self):
         # Prepare entries
@@ -150,5 +324,292 @@ class TestGenerateReports(unittest.TestCase):
             )
         os.remove(output_docx)
 
+    def test_tables_use_entry_style_without_cell_shading(self):
+        """Check that shading and borders come from the shared table style."""
+        entries = [{
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Key Aspects": "- Aspect 1\n- Aspect 2",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }] * 2
+        output_docx = "test_output.docx"
+        create_word(entries, output_docx)
+        doc = DocxDocument(output_docx)
+        style = doc.styles[ENTRY_TABLE_STYLE]
+        self.assertIn('w:type="firstCol"', style._element.xml)
+        self.assertIn('w:fill="579B9C"', style._element.xml)
+        self.assertIn('w:color="B3E0E2"', style._element.xml)
+        for table in doc.tables:
+            self.assertEqual(table.style.name, ENTRY_TABLE_STYLE)
+            self.assertNotIn("<w:shd", table._tbl.xml)
+            self.assertNotIn("<w:tcBorders", table._tbl.xml)
+        os.remove(output_docx)
+
+    def test_dense_pdf_packs_entries(self):
+        entries = [{
+            "Title": f"Test Entry {i}",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Key Aspects": "- Aspect 1\n- Aspect 2",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        } for i in range(6)]
+        output_pdf = "test_output.pdf"
+        self.assertEqual(create_pdf(entries, output_pdf), 6)
+        paged_size = os.path.getsize(output_pdf)
+        self.assertLess(create_pdf(entries, output_pdf, dense=True), 6)
+        self.assertLess(os.path.getsize(output_pdf), paged_size)
+        os.remove(output_pdf)
+
+    def test_dense_word_keeps_tables_together_without_page_breaks(self):
+        entries = [{
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }] * 3
+        output_docx = "test_output.docx"
+        create_word(entries, output_docx, dense=True)
+        doc = DocxDocument(output_docx)
+        style = doc.styles[DENSE_ENTRY_TABLE_STYLE]
+        self.assertIn("<w:keepNext/>", style._element.xml)
+        self.assertIn("<w:cantSplit/>", style._element.xml)
+        self.assertEqual(len(doc.tables), 3)
+        for table in doc.tables:
+            self.assertEqual(table.style.name, DENSE_ENTRY_TABLE_STYLE)
+        self.assertNotIn('w:type="page"', doc.element.body.xml)
+        os.remove(output_docx)
+
+    def test_dense_gap_must_not_be_negative(self):
+        entry = {
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }
+        with self.assertRaises(ValueError):
+            create_pdf([entry], "test_output.pdf", dense=True, gap=-200)
+        with self.assertRaises(ValueError):
+            create_word([entry], "test_output.docx", dense=True, gap=-1)
+        self.assertFalse(os.path.exists("test_output.pdf"))
+        self.assertFalse(os.path.exists("test_output.docx"))
+
+    def test_dense_word_zero_gap_keeps_a_line(self):
+        entries = [{
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }] * 2
+        output_docx = "test_output.docx"
+        create_word(entries, output_docx, dense=True, gap=0)
+        doc = DocxDocument(output_docx)
+        os.remove(output_docx)
+        spacing = doc.paragraphs[0].paragraph_format.line_spacing
+        self.assertEqual(spacing.pt, MIN_WORD_ENTRY_GAP)
+
+    def test_ignored_options(self):
+        import argparse
+        def options(**kwargs):
+            args = dict(check=False, word=False, dense=False, gap=None,
+                        optimize_pdf=False, sort=None, jobs=None)
+            args.update(kwargs)
+            return [option for option, _ in
+                    ignored_options(argparse.Namespace(**args))]
+        self.assertEqual(options(dense=True, gap=6), [])
+        self.assertEqual(options(gap=6), ["--gap"])
+        self.assertEqual(options(word=True, optimize_pdf=True),
+                         ["--optimize-pdf"])
+        self.assertEqual(options(check=True, dense=True, sort="date"),
+                         ["--dense", "--sort"])
+        self.assertEqual(options(jobs=2), ["--jobs"])
+
+    def test_create_pdf_reports_cache_stats_per_document(self):
+        from unittest import mock
+        entries = [{
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }]
+        output_pdf = "test_output.pdf"
+        create_pdf(entries, output_pdf)
+        with mock.patch("builtins.print") as printed:
+            create_pdf(entries, output_pdf)
+        os.remove(output_pdf)
+        line = [c.args[0] for c in printed.call_args_list
+                if "Text layout cache" in str(c.args[0])][0]
+        # Every paragraph was laid out by the first render
+        self.assertIn("Date 100.0% (1 hits, 0 misses)", line)
+        self.assertIn("Availability 100.0% (1 hits, 0 misses)", line)
+
+    def test_optimized_pdf_is_smaller_with_shared_chrome(self):
+        from reportlab import rl_config
+        entries = [{
+            "Title": f"Test Entry {i}",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Key Aspects": "- Aspect 1\n- Aspect 2",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        } for i in range(20)]
+        use_a85 = rl_config.useA85
+        output_pdf = "test_output.pdf"
+        default_pages = create_pdf(entries, output_pdf)
+        default_size = os.path.getsize(output_pdf)
+        self.assertEqual(create_pdf(entries, output_pdf, optimize=True),
+                         default_pages)
+        with open(output_pdf, "rb") as f:
+            data = f.read()
+        os.remove(output_pdf)
+        self.assertLess(len(data), default_size)
+        self.assertIn(b"/FormXob.EntryChromeTop", data)
+        self.assertIn(b"/FormXob.EntryChromeBottom", data)
+        self.assertNotIn(b"/ASCII85Decode", data)
+        self.assertEqual(rl_config.useA85, use_a85)
+
+    def test_shared_chrome_table_leaves_labels_to_forms(self):
+        table = build_table_for_entry({
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }, shared_chrome=True)
+        self.assertEqual(table._cellvalues[0][0], '')
+        self.assertEqual(table._cellvalues[2][0], '')
+        # The Summary row grows with its content and keeps its own label
+        self.assertNotEqual(table._cellvalues[1][0], '')
+
+    def test_chrome_forms_leave_backgrounds_to_the_page(self):
+        import generate_reports
+        entry = {
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }
+        shared = build_table_for_entry(entry, shared_chrome=True)
+        plain = build_table_for_entry(entry)
+        # Fills drawn inside a form would composite differently at the
+        # cell edges, so every background stays in the page's table
+        self.assertEqual(shared._bkgrndcmds, plain._bkgrndcmds)
+        for band in generate_reports._pdf_chrome_tables.values():
+            self.assertEqual(band._bkgrndcmds, [])
+
+    def test_optimized_pdf_splits_tall_tables(self):
+        entries = [{
+            "Title": "Long Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": " ".join(["lorem ipsum dolor"] * 180),
+            "Key Aspects": "\n".join(f"- Aspect {i}" for i in range(8)),
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }] * 2
+        output_pdf = "test_output.pdf"
+        try:
+            for dense in (False, True):
+                pages = create_pdf(entries, output_pdf, dense=dense)
+                # Each table is taller than a frame and has to split
+                self.assertGreater(pages, len(entries))
+                self.assertEqual(
+                    create_pdf(entries, output_pdf, dense=dense,
+                               optimize=True), pages)
+        finally:
+            os.remove(output_pdf)
+
+    def test_optimized_pdf_without_entries(self):
+        output_pdf = "test_output.pdf"
+        self.assertEqual(create_pdf([], output_pdf, optimize=True), 0)
+        os.remove(output_pdf)
+
+    def test_failed_optimized_build_leaves_no_file(self):
+        from unittest import mock
+        output_pdf = "test_output.pdf"
+        with mock.patch("generate_reports.SimpleDocTemplate.build",
+                        side_effect=RuntimeError("boom")):
+            with self.assertRaises(RuntimeError):
+                create_pdf([{
+                    "Title": "Test Entry",
+                    "Date": "2024-01-01",
+                    "Country": "Testland",
+                    "Summary": "This is a summary.",
+                    "Link": "http://example.com",
+                    "Availability": "Public"
+                }], output_pdf, optimize=True)
+        self.assertFalse(os.path.exists(output_pdf))
+
+    def test_entry_style_fills_each_grid_column(self):
+        """Resolve each cell's fill the way Word applies the table style."""
+        from docx.oxml.ns import qn
+        entries = [{
+            "Title": "Test Entry",
+            "Date": "2024-01-01",
+            "Country": "Testland",
+            "Summary": "This is a summary.",
+            "Link": "http://example.com",
+            "Availability": "Public"
+        }]
+        output_docx = "test_output.docx"
+        create_word(entries, output_docx)
+        doc = DocxDocument(output_docx)
+        os.remove(output_docx)
+        style = doc.styles[ENTRY_TABLE_STYLE]._element
+
+        def fill(tc_pr):
+            return tc_pr.find(qn('w:shd')).get(qn('w:fill'))
+
+        table_fill = fill(style.find(qn('w:tcPr')))
+        conditional = {
+            pr.get(qn('w:type')): fill(pr.find(qn('w:tcPr')))
+            for pr in style.findall(qn('w:tblStylePr'))
+        }
+        table = doc.tables[0]
+        look = table._tbl.tblPr.find(qn('w:tblLook'))
+        first_column = look.get(qn('w:firstColumn')) == "1"
+        vertical_bands = look.get(qn('w:noVBand')) == "0"
+
+        def effective_fill(grid_col):
+            if first_column and grid_col == 0:
+                return conditional["firstCol"]
+            if vertical_bands:
+                # Banding starts after the first column when it is enabled
+                band = grid_col - 1 if first_column else grid_col
+                return conditional["band1Vert" if band % 2 == 0 else "band2Vert"]
+            return table_fill
+
+        label, value = "579B9C", "E2F3F3"
+        self.assertEqual([effective_fill(col) for col in range(6)],
+                         [label, value, label, value, label, value])
+        for row in table._tbl.tr_lst:
+            grid_cols = []
+            col = 0
+            for tc in row.tc_lst:
+                grid_cols.append(col)
+                col += tc.grid_span
+            fills = [effective_fill(col) for col in grid_cols]
+            if len(grid_cols) == 2:
+                # Summary, Link and Availability: label, merged value
+                self.assertEqual(fills, [label, value])
+            else:
+                self.assertEqual(fills, [label, value] * 3)
+
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file